@@ -0,0 +1,3 @@
+from .render import render_app
+
+__all__ = ["render_app"]
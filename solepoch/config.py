@@ -0,0 +1,14 @@
+RPC_URL = "https://api.mainnet-beta.solana.com"
+SLOTS_PER_EPOCH = 432000
+FIXED_SLOT_DURATION = 0.4
+TRACKING_FILE = "realtime_epoch_data.db"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+HISTORY_PAGE_SIZE = 50
+RPC_CONCURRENCY = 16
+RPC_BATCH_SIZE = 100
+BLOCK_SIGNATURES_CONFIG = {"transactionDetails": "signatures", "rewards": False, "maxSupportedTransactionVersion": 0}
+
+# Feature flags
+SHOW_HISTORICAL_FULL = True
+SHOW_EPOCH_STATS = True
+ENABLE_TX_ESTIMATE = True
@@ -0,0 +1,32 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from .config import SLOTS_PER_EPOCH, FIXED_SLOT_DURATION
+
+EPOCH_DURATION = pd.Timedelta(seconds=SLOTS_PER_EPOCH * FIXED_SLOT_DURATION)
+
+@st.cache_data(ttl=600)
+def generate_full_epoch_history(current_epoch, current_starting_slot):
+    i = np.arange(current_epoch + 1, dtype=np.int64)
+    start_slot = current_starting_slot - SLOTS_PER_EPOCH * i
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("s")
+    est_start = now - i * EPOCH_DURATION
+    est_end = est_start + EPOCH_DURATION
+    df = pd.DataFrame({
+        "Epoch": current_epoch - i,
+        "Start Slot": start_slot,
+        "End Slot": start_slot + SLOTS_PER_EPOCH - 1,
+        "Start Block": "Approximate",
+        "End Block": "Approximate",
+        "Est. Start Time (UTC)": est_start,
+        "Est. End Time (UTC)": est_end
+    })
+    # Times stay datetime64 for st.dataframe; they are only formatted on CSV export.
+    return df.astype({
+        "Epoch": "int32",
+        "Start Slot": "int64",
+        "End Slot": "int64",
+        "Start Block": "category",
+        "End Block": "category"
+    })
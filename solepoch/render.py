@@ -0,0 +1,75 @@
+import streamlit as st
+from datetime import datetime, timedelta
+
+from .config import (
+    SLOTS_PER_EPOCH, TIMESTAMP_FORMAT, HISTORY_PAGE_SIZE, SHOW_HISTORICAL_FULL, SHOW_EPOCH_STATS, ENABLE_TX_ESTIMATE
+)
+from .rpc import get_epoch_info, estimate_slot_duration, estimate_total_transactions
+from .stats import is_epoch_recorded, record_epoch_stats, load_epoch_stats
+from .history import generate_full_epoch_history
+
+@st.cache_data(max_entries=4)
+def _to_csv_bytes(df):
+    return df.to_csv(index=False, date_format=TIMESTAMP_FORMAT).encode("utf-8")
+
+@st.cache_data(max_entries=4)
+def _to_parquet_bytes(df):
+    return df.to_parquet(index=False, compression="snappy")
+
+def render_current_epoch(data, slot_duration):
+    epoch = data['epoch']
+    slot_index = data['slotIndex']
+    slots_in_epoch = data['slotsInEpoch']
+    remaining_slots = slots_in_epoch - slot_index
+    pct_done = (slot_index / slots_in_epoch) * 100
+    time_remaining = timedelta(seconds=int(remaining_slots * slot_duration))
+    estimated_end = datetime.utcnow() + time_remaining
+
+    start_slot = data['absoluteSlot'] - data['slotIndex']
+
+    st.subheader("📈 Current Epoch Summary")
+    st.metric("Epoch", epoch)
+    st.metric("Slot Index", f"{slot_index:,} / {slots_in_epoch:,}")
+    st.progress(pct_done / 100)
+    st.metric("Progress", f"{pct_done:.2f}%")
+    st.metric("Time Remaining", str(time_remaining))
+    st.metric("Estimated Epoch End (UTC)", estimated_end.strftime("%b %d, %Y, %H:%M UTC"))
+    st.caption(f"🧠 Estimated Slot Duration: {slot_duration:.3f} seconds (adaptive)")
+
+    # If we're at the beginning of a new epoch, estimate tx count for the one that just ended
+    if ENABLE_TX_ESTIMATE and slot_index < 10 and epoch > 0 and not is_epoch_recorded(epoch - 1):
+        tx_estimate = estimate_total_transactions(start_slot - SLOTS_PER_EPOCH, start_slot - 1)
+        if tx_estimate is not None:
+            record_epoch_stats(epoch - 1, tx_estimate)
+
+def render_historical(df):
+    st.subheader("📜 Full Historical Epochs (Estimated)")
+    max_page = max(1, -(-len(df) // HISTORY_PAGE_SIZE))
+    page = st.number_input("Page", min_value=1, max_value=max_page, value=1, step=1)
+    offset = (page - 1) * HISTORY_PAGE_SIZE
+    st.dataframe(df.iloc[offset:offset + HISTORY_PAGE_SIZE], use_container_width=True)
+    st.caption(f"Page {page} of {max_page} ({len(df):,} epochs)")
+    csv = _to_csv_bytes(df)
+    st.download_button("📥 Download History CSV", data=csv, file_name="solana_epoch_history.csv")
+    st.download_button("📥 Download History Parquet", data=_to_parquet_bytes(df), file_name="solana_epoch_history.parquet")
+
+def render_epoch_stats():
+    df = load_epoch_stats()
+    if not df.empty:
+        st.subheader("🧾 Recorded Epoch Stats (Forward-Tracked Only)")
+        st.dataframe(df, use_container_width=True)
+        csv = _to_csv_bytes(df)
+        st.download_button("📥 Download Stats CSV", data=csv, file_name="realtime_epoch_stats.csv")
+        st.download_button("📥 Download Stats Parquet", data=_to_parquet_bytes(df), file_name="realtime_epoch_stats.parquet")
+
+def render_app():
+    data = get_epoch_info()
+    if not data:
+        return
+    live_slot_duration = estimate_slot_duration()
+    render_current_epoch(data, live_slot_duration)
+    if SHOW_HISTORICAL_FULL:
+        hist_df = generate_full_epoch_history(data['epoch'], data['absoluteSlot'] - data['slotIndex'])
+        render_historical(hist_df)
+    if SHOW_EPOCH_STATS:
+        render_epoch_stats()
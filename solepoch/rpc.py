@@ -0,0 +1,97 @@
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+import aiohttp
+import asyncio
+import orjson
+import numpy as np
+
+from .config import (
+    RPC_URL, FIXED_SLOT_DURATION, RPC_CONCURRENCY, RPC_BATCH_SIZE, BLOCK_SIGNATURES_CONFIG
+)
+
+@st.cache_resource
+def _rpc_client():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+def rpc_call(method, params=None):
+    payload = {"jsonrpc": "2.0", "id": 1, "method": method}
+    if params is not None:
+        payload["params"] = params
+    response = _rpc_client().post(RPC_URL, json=payload, timeout=5)
+    return orjson.loads(response.content)["result"]
+
+@st.cache_data(ttl=300)
+def estimate_slot_duration(samples=5):
+    try:
+        result = rpc_call("getRecentPerformanceSamples", [samples])
+    except Exception:
+        return FIXED_SLOT_DURATION
+    total_slots = sum(sample["numSlots"] for sample in result)
+    total_secs = sum(sample["samplePeriodSecs"] for sample in result)
+    return total_secs / total_slots if total_slots else FIXED_SLOT_DURATION
+
+@st.cache_data(ttl=10)
+def _fetch_epoch_info():
+    return rpc_call("getEpochInfo")
+
+def get_epoch_info():
+    # Errors raise out of the cached fetch so failures are not cached.
+    try:
+        return _fetch_epoch_info()
+    except Exception as e:
+        st.error(f"Failed to fetch epoch info: {e}")
+        return None
+
+async def _get_block_batch(session, semaphore, slots):
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": "getBlock", "params": [slot, BLOCK_SIGNATURES_CONFIG]}
+        for i, slot in enumerate(slots)
+    ]
+    async with semaphore:
+        try:
+            async with session.post(RPC_URL, json=payload) as response:
+                results = orjson.loads(await response.read())
+        except Exception:
+            return [None] * len(slots)
+    blocks = [None] * len(slots)
+    if isinstance(results, list):
+        for item in results:
+            if isinstance(item.get("id"), int) and 0 <= item["id"] < len(slots):
+                blocks[item["id"]] = item.get("result")
+    return blocks
+
+async def _get_blocks(slots):
+    # aiohttp sessions are bound to the event loop that created them, and
+    # asyncio.run() starts a fresh loop per call, so the session lives for one fetch.
+    slots = list(slots)
+    batches = [slots[i:i + RPC_BATCH_SIZE] for i in range(0, len(slots), RPC_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(RPC_CONCURRENCY)
+    connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(*(_get_block_batch(session, semaphore, batch) for batch in batches))
+    return [block for batch in results for block in batch]
+
+# Called with the previous (completed) epoch's slot range and keyed on it, so the
+# sampling runs once per epoch boundary rather than on every rerun while slot_index < 10.
+@st.cache_data(ttl=3600)
+def _estimate_total_transactions(start_slot, end_slot, sample_rate=1000):
+    blocks = asyncio.run(_get_blocks(range(start_slot, end_slot, sample_rate)))
+    tx_counts = np.fromiter(
+        (len(block["signatures"]) for block in blocks if block and "signatures" in block),
+        dtype=np.int64
+    )
+    if not tx_counts.size:
+        raise RuntimeError(f"No blocks sampled between slots {start_slot} and {end_slot}")
+    estimated_total = tx_counts.mean() * (end_slot - start_slot)
+    return int(estimated_total)
+
+def estimate_total_transactions(start_slot, end_slot, sample_rate=1000):
+    # Errors raise out of the cached estimate so failed sampling is retried, not cached.
+    try:
+        return _estimate_total_transactions(start_slot, end_slot, sample_rate)
+    except Exception:
+        return None
@@ -0,0 +1,70 @@
+import streamlit as st
+from datetime import datetime
+import pandas as pd
+import sqlite3
+import os
+import threading
+
+from .config import TRACKING_FILE, TIMESTAMP_FORMAT
+
+# The connection is shared by every session thread, so all use goes through the lock.
+@st.cache_resource
+def _db(db_path=TRACKING_FILE):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS stats (epoch INTEGER PRIMARY KEY, tx_estimate INTEGER, ts TEXT)")
+    legacy_path = os.path.splitext(db_path)[0] + ".csv"
+    if os.path.exists(legacy_path):
+        _import_legacy_csv(conn, legacy_path)
+    return conn, threading.Lock()
+
+def _import_legacy_csv(conn, file_path):
+    # Stats are forward-tracked only, so rows from the pre-SQLite CSV store can't be
+    # regenerated. The CSV is renamed only after its rows are committed, so a failed
+    # import is retried on the next start instead of being lost.
+    try:
+        legacy = pd.read_csv(file_path)
+        epochs = pd.to_numeric(legacy["Epoch"], errors="coerce")
+        tx_estimates = pd.to_numeric(legacy["Estimated Total Transactions"], errors="coerce")
+        valid = epochs.notna() & tx_estimates.notna()
+        rows = zip(
+            epochs[valid].astype("int64").tolist(),
+            tx_estimates[valid].astype("int64").tolist(),
+            legacy.loc[valid, "Timestamp"].fillna("").astype(str).tolist()
+        )
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO stats VALUES (?, ?, ?)", rows)
+        os.replace(file_path, file_path + ".imported")
+    except Exception as e:
+        st.warning(f"Failed to import legacy epoch stats from {file_path}: {e}")
+
+def _recorded_epochs(db_path):
+    key = f"recorded_epochs:{db_path}"
+    if key not in st.session_state:
+        conn, lock = _db(db_path)
+        with lock:
+            rows = conn.execute("SELECT epoch FROM stats").fetchall()
+        st.session_state[key] = {row[0] for row in rows}
+    return st.session_state[key]
+
+def is_epoch_recorded(epoch, db_path=TRACKING_FILE):
+    return epoch in _recorded_epochs(db_path)
+
+def record_epoch_stats(epoch, tx_estimate, db_path=TRACKING_FILE):
+    seen = _recorded_epochs(db_path)
+    if epoch in seen:
+        return
+    timestamp = datetime.utcnow().strftime(TIMESTAMP_FORMAT)
+    conn, lock = _db(db_path)
+    with lock:
+        conn.execute("INSERT OR IGNORE INTO stats VALUES (?, ?, ?)", (epoch, tx_estimate, timestamp))
+        conn.commit()
+    seen.add(epoch)
+
+def load_epoch_stats(db_path=TRACKING_FILE):
+    conn, lock = _db(db_path)
+    with lock:
+        return pd.read_sql(
+            'SELECT epoch AS "Epoch", tx_estimate AS "Estimated Total Transactions", ts AS "Timestamp" '
+            "FROM stats ORDER BY epoch",
+            conn
+        )